@@ -1,80 +1,158 @@
 import os
 import sys
+import threading
+import time
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory
-from flask_cors import CORS
-from flask_jwt_extended import JWTManager
-from src.models.user import db
-from src.routes.auth import auth_bp
-from src.routes.agency import agency_bp
-from src.routes.client import client_bp
-
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'ai-growth-secret-key-2025')
-app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'ai-growth-jwt-secret-2025')
-
-# Enable CORS for frontend-backend communication
-CORS(app, origins="*")
-
-# Initialize JWT
-jwt = JWTManager(app)
-
-# Database configuration - Railway MySQL
-if os.getenv('DATABASE_URL'):
-    # Railway provides DATABASE_URL
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
-elif os.getenv('DB_HOST'):
-    # Use individual Railway variables
-    db_user = os.getenv('DB_USERNAME', 'root')
-    db_password = os.getenv('DB_PASSWORD', '')
-    db_host = os.getenv('DB_HOST', 'localhost')
-    db_port = os.getenv('DB_PORT', '3306')
-    db_name = os.getenv('DB_NAME', 'railway')
-    app.config['SQLALCHEMY_DATABASE_URI'] = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-else:
-    # Local development fallback
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///local.db'
-
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
-
-# Register blueprints
-app.register_blueprint(auth_bp, url_prefix='/api/auth')
-app.register_blueprint(agency_bp, url_prefix='/api/agency')
-app.register_blueprint(client_bp, url_prefix='/api/client')
-
-# Health check endpoint
-@app.route('/health')
-def health_check():
-    return {'status': 'healthy', 'service': 'AI.GROWTH Backend'}, 200
-
-# Create tables
-with app.app_context():
-    try:
-        db.create_all()
-        print("✅ Database tables created successfully")
-    except Exception as e:
-        print(f"❌ Database error: {e}")
-
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    static_folder_path = app.static_folder
-    if static_folder_path is None:
-            return "Static folder not configured", 404
-
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
+# Reference point for the startup timings reported by /health. This is taken when
+# src/main.py is imported, so interpreter startup is not included
+MODULE_IMPORT_START = time.perf_counter()
+
+# Endpoints that must answer without touching the database (Railway healthcheck)
+NO_DB_ENDPOINTS = {'health_check', 'serve', 'static'}
+
+# Backoff after a failed schema check: starts at SCHEMA_RETRY_SECONDS and doubles up to the max
+SCHEMA_RETRY_SECONDS = 0.5
+SCHEMA_RETRY_MAX_SECONDS = 30
+
+# How long a request waits for another request's schema check before going ahead anyway
+SCHEMA_LOCK_TIMEOUT = 10
+
+
+def get_database_uri():
+    # Database configuration - Railway MySQL
+    if os.getenv('DATABASE_URL'):
+        # Railway provides DATABASE_URL
+        return os.getenv('DATABASE_URL')
+    elif os.getenv('DB_HOST'):
+        # Use individual Railway variables
+        db_user = os.getenv('DB_USERNAME', 'root')
+        db_password = os.getenv('DB_PASSWORD', '')
+        db_host = os.getenv('DB_HOST', 'localhost')
+        db_port = os.getenv('DB_PORT', '3306')
+        db_name = os.getenv('DB_NAME', 'railway')
+        return f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
     else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
+        # Local development fallback
+        return 'sqlite:///local.db'
+
+
+def register_blueprints(app):
+    # Route modules pull in JWT/SQLAlchemy helpers, so they are only imported
+    # once an app is actually being built
+    from src.routes.auth import auth_bp
+    from src.routes.agency import agency_bp
+    from src.routes.client import client_bp
+
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(agency_bp, url_prefix='/api/agency')
+    app.register_blueprint(client_bp, url_prefix='/api/client')
+
+
+def create_app(config=None):
+    from flask import Flask, request, send_from_directory
+    from flask_cors import CORS
+    from flask_jwt_extended import JWTManager
+    from src.models.user import db, ensure_schema
+
+    app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'ai-growth-secret-key-2025')
+    app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'ai-growth-jwt-secret-2025')
+    app.config['SQLALCHEMY_DATABASE_URI'] = get_database_uri()
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if config:
+        app.config.update(config)
+
+    # Enable CORS for frontend-backend communication
+    CORS(app, origins="*")
+
+    # Initialize JWT
+    JWTManager(app)
+
+    db.init_app(app)
+    register_blueprints(app)
+
+    # Seconds since src/main.py was imported
+    startup = {
+        'app_ready_seconds': round(time.perf_counter() - MODULE_IMPORT_START, 4),
+        'first_request_seconds': None,
+    }
+    schema_state = {'checked': False, 'retry_at': 0.0, 'backoff': 0.0}
+    schema_lock = threading.Lock()
+    retry_seconds = app.config.get('SCHEMA_RETRY_SECONDS', SCHEMA_RETRY_SECONDS)
+    retry_max_seconds = app.config.get('SCHEMA_RETRY_MAX_SECONDS', SCHEMA_RETRY_MAX_SECONDS)
+    lock_timeout = app.config.get('SCHEMA_LOCK_TIMEOUT', SCHEMA_LOCK_TIMEOUT)
+
+    @app.before_request
+    def record_first_request():
+        if startup['first_request_seconds'] is None:
+            startup['first_request_seconds'] = round(time.perf_counter() - MODULE_IMPORT_START, 4)
+
+    # Schema check runs on the first request that needs the database instead of at boot.
+    # A failed check is logged and the request still goes through, like the old create_all at boot
+    @app.before_request
+    def check_schema():
+        if schema_state['checked'] or request.method == 'OPTIONS':
+            return
+        if request.endpoint is None or request.endpoint in NO_DB_ENDPOINTS:
+            return
+        if time.monotonic() < schema_state['retry_at']:
+            return
+        # Concurrent requests wait for the running check instead of repeating it
+        if not schema_lock.acquire(timeout=lock_timeout):
+            return
+        try:
+            if schema_state['checked'] or time.monotonic() < schema_state['retry_at']:
+                return
+            if ensure_schema():
+                print("✅ Database tables created successfully")
+            schema_state['checked'] = True
+        except Exception as e:
+            db.session.rollback()
+            schema_state['backoff'] = min(max(schema_state['backoff'] * 2, retry_seconds), retry_max_seconds)
+            schema_state['retry_at'] = time.monotonic() + schema_state['backoff']
+            print(f"❌ Database error: {e}")
+        finally:
+            schema_lock.release()
+
+    # Health check endpoint
+    @app.route('/health')
+    def health_check():
+        return {'status': 'healthy', 'service': 'AI.GROWTH Backend', 'startup': startup}, 200
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve(path):
+        static_folder_path = app.static_folder
+        if static_folder_path is None:
+                return "Static folder not configured", 404
+
+        if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
+            return send_from_directory(static_folder_path, path)
         else:
-            return "index.html not found", 404
+            index_path = os.path.join(static_folder_path, 'index.html')
+            if os.path.exists(index_path):
+                return send_from_directory(static_folder_path, 'index.html')
+            else:
+                return "index.html not found", 404
+
+    return app
+
+
+_app = None
+
+
+def __getattr__(name):
+    # Keeps `from src.main import app` working without building the app at import time
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    create_app().run(host='0.0.0.0', port=port, debug=False)
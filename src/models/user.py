@@ -1,4 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 
@@ -100,3 +102,37 @@ class Campaign(db.Model):
             'roas': round(roas, 2),
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+# Bump this when a model (table) is added so ensure_schema() runs create_all again.
+# create_all only creates missing tables: column changes need a real migration (ALTER or Alembic)
+SCHEMA_VERSION = 1
+
+class SchemaVersion(db.Model):
+    __tablename__ = 'schema_version'
+    
+    version = db.Column(db.Integer, primary_key=True)
+
+def ensure_schema():
+    """Cria as tabelas apenas se a versão gravada no banco estiver desatualizada"""
+    try:
+        current = db.session.execute(db.select(db.func.max(SchemaVersion.version))).scalar()
+    except (OperationalError, ProgrammingError):
+        db.session.rollback()
+        # Só trata como "tabela ausente" se ela realmente não existir (erros de conexão sobem)
+        if inspect(db.engine).has_table(SchemaVersion.__tablename__):
+            raise
+        current = None
+    
+    if current is not None and current >= SCHEMA_VERSION:
+        return False
+    
+    db.create_all()
+    try:
+        updated = db.session.query(SchemaVersion).update({SchemaVersion.version: SCHEMA_VERSION})
+        if not updated:
+            db.session.add(SchemaVersion(version=SCHEMA_VERSION))
+        db.session.commit()
+    except IntegrityError:
+        # Outro processo gravou a mesma versão ao mesmo tempo
+        db.session.rollback()
+    return True
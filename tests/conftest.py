@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def app():
+    from src.main import create_app
+
+    return create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+
+def pytest_terminal_summary(terminalreporter):
+    # Startup benchmark: tests store their timings with record_property('<name>_ms', ...)
+    timings = [
+        (report.nodeid, name, value)
+        for report in terminalreporter.stats.get('passed', []) + terminalreporter.stats.get('failed', [])
+        if report.when == 'call'
+        for name, value in report.user_properties
+        if name.endswith('_ms')
+    ]
+    if not timings:
+        return
+    terminalreporter.write_sep('-', 'startup timings')
+    for nodeid, name, value in timings:
+        terminalreporter.write_line(f"{name:<28} {value:>9.1f} ms  ({nodeid.split('::')[-1]})")
@@ -0,0 +1,198 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+from sqlalchemy import event
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous ceilings: these catch regressions such as a DB round trip at boot,
+# the timings shown in the "startup timings" summary are the benchmark itself
+IMPORT_BUDGET_SECONDS = 1.0
+FIRST_HEALTH_BUDGET_SECONDS = 10.0
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_main_is_lazy(record_property):
+    data = run_python(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import src.main\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = [m for m in sys.modules if m == 'flask' or m.startswith('src.routes')"
+        " or m.startswith('flask_sqlalchemy')]\n"
+        "print(json.dumps({'seconds': elapsed, 'heavy': heavy}))"
+    )
+    record_property('import_main_ms', data['seconds'] * 1000)
+    assert data['heavy'] == []
+    assert data['seconds'] < IMPORT_BUDGET_SECONDS
+
+
+def test_create_app_and_first_health(record_property):
+    data = run_python(
+        "import json, time\n"
+        "start = time.perf_counter()\n"
+        "from src.main import create_app\n"
+        "app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})\n"
+        "ready = time.perf_counter() - start\n"
+        "response = app.test_client().get('/health')\n"
+        "first = time.perf_counter() - start\n"
+        "print(json.dumps({'ready': ready, 'first': first, 'status': response.status_code,"
+        " 'body': response.get_json()}))"
+    )
+    record_property('create_app_ms', data['ready'] * 1000)
+    record_property('create_app_first_health_ms', data['first'] * 1000)
+    assert data['status'] == 200
+    assert data['body']['startup']['first_request_seconds'] is not None
+    assert data['first'] < FIRST_HEALTH_BUDGET_SECONDS
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_entry_point_first_health(tmp_path, record_property):
+    # Same command as the Procfile and railway.toml, so the real cold start is measured
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), DATABASE_URL=f"sqlite:///{tmp_path / 'boot.db'}")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'src/main.py'], cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        body = None
+        while time.perf_counter() - start < FIRST_HEALTH_BUDGET_SECONDS:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1) as response:
+                    body = json.load(response)
+                break
+            except OSError:
+                time.sleep(0.02)
+        elapsed = time.perf_counter() - start
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    assert body is not None, 'server did not answer /health in time'
+    record_property('entry_point_first_health_ms', elapsed * 1000)
+    assert body['startup']['first_request_seconds'] is not None
+    # /health must not have created the database
+    assert not (tmp_path / 'boot.db').exists()
+
+
+def test_health_opens_no_db_connection(app):
+    from src.models.user import db
+
+    checkouts = []
+    with app.app_context():
+        event.listen(db.engine, 'checkout', lambda *args: checkouts.append(args))
+
+    client = app.test_client()
+    assert client.get('/health').status_code == 200
+    assert client.get('/').status_code in (200, 404)
+    assert checkouts == []
+
+
+def test_first_api_request_creates_schema(app):
+    from src.models.user import SCHEMA_VERSION, SchemaVersion, db
+
+    response = app.test_client().post('/api/auth/login', json={})
+    assert response.status_code == 400
+
+    with app.app_context():
+        assert db.session.execute(db.select(SchemaVersion.version)).scalar() == SCHEMA_VERSION
+
+
+def test_concurrent_requests_wait_for_schema_check(monkeypatch):
+    import src.models.user as models
+    from src.main import create_app
+
+    real_ensure_schema = models.ensure_schema
+    calls = []
+
+    def slow_schema():
+        calls.append(1)
+        time.sleep(0.5)
+        return real_ensure_schema()
+
+    monkeypatch.setattr(models, 'ensure_schema', slow_schema)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+    statuses = []
+
+    def login():
+        statuses.append(app.test_client().post('/api/auth/login', json={}).status_code)
+
+    threads = [threading.Thread(target=login) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [400, 400, 400]
+    assert len(calls) == 1
+
+
+def test_schema_failure_backs_off(monkeypatch):
+    import src.models.user as models
+    from src.main import create_app
+
+    calls = []
+
+    def broken_schema():
+        calls.append(1)
+        raise RuntimeError('database unreachable')
+
+    monkeypatch.setattr(models, 'ensure_schema', broken_schema)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SCHEMA_RETRY_SECONDS': 0.2})
+    client = app.test_client()
+
+    # A failed check is logged and the request still reaches the route
+    assert client.post('/api/auth/login', json={}).status_code == 400
+    assert client.post('/api/auth/login', json={}).status_code == 400
+    assert len(calls) == 1
+
+    time.sleep(0.25)
+    assert client.post('/api/auth/login', json={}).status_code == 400
+    assert len(calls) == 2
+
+
+def test_preflight_and_unknown_routes_skip_schema_check(monkeypatch):
+    import src.models.user as models
+    from src.main import create_app
+
+    calls = []
+    monkeypatch.setattr(models, 'ensure_schema', lambda: calls.append(1))
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+    client = app.test_client()
+
+    response = client.options(
+        '/api/auth/login',
+        headers={'Origin': 'http://example.com', 'Access-Control-Request-Method': 'POST'}
+    )
+    assert response.status_code == 200
+    assert client.put('/api/auth/login').status_code == 405
+    assert calls == []
+
+
+def test_ensure_schema_is_idempotent(app):
+    from src.models.user import SCHEMA_VERSION, SchemaVersion, db, ensure_schema
+
+    with app.app_context():
+        assert ensure_schema() is True
+        assert ensure_schema() is False
+        versions = db.session.execute(db.select(SchemaVersion.version)).scalars().all()
+        assert versions == [SCHEMA_VERSION]